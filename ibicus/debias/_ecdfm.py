@@ -9,9 +9,15 @@
 from typing import Union
 
 import attrs
+import numpy as np
 import scipy.stats
 
-from ..utils import PrecipitationHurdleModelGamma, StatisticalModel, threshold_cdf_vals
+from ..utils import (
+    PrecipitationHurdleModelGamma,
+    RunningWindowOverDaysOfYear,
+    StatisticalModel,
+)
+from ..utils._math_utils import _fast_cdf, _fast_fit, _fast_ppf
 from ..variables import (
     Variable,
     hurs,
@@ -24,6 +30,7 @@ from ..variables import (
     tasmax,
     tasmin,
 )
+from ._ecdfm_kernels import get_ecdfm_transform
 from ._running_window_debiaser import RunningWindowDebiaser
 
 # ----- Default settings for debiaser ----- #
@@ -105,6 +112,8 @@ class ECDFM(RunningWindowDebiaser):
         Usually a distribution in ``scipy.stats.rv_continuous``, but can also be an empirical distribution as given by ``scipy.stats.rv_histogram`` or a more complex statistical model as wrapped by the :py:class:`ibicus.utils.StatisticalModel` class.
     cdf_threshold : float
         Threshold to round CDF-values away from zero and one. Default: ``1e-10``.
+    use_float32 : bool
+        If ``True`` the fits and cdf-/ppf-evaluations run in float32 instead of float64, halving the memory footprint and speeding up the memory-bound passes. Daily temperature and precipitation values have far coarser physical resolution than float32 precision, however the default stays ``False`` for backward compatible results. The output dtype is unchanged.
 
     running_window_mode : bool
         Whether DeltaChange is used in running window over the year to account for seasonality. If ``running_window_mode = False`` then DeltaChange is applied on the whole period. Default: ``False``.
@@ -135,6 +144,9 @@ class ECDFM(RunningWindowDebiaser):
     cdf_threshold: float = attrs.field(
         default=1e-10, validator=attrs.validators.instance_of(float)
     )
+    use_float32: bool = attrs.field(
+        default=False, validator=attrs.validators.instance_of(bool)
+    )
 
     # Running window mode
     running_window_mode: bool = attrs.field(
@@ -196,17 +208,190 @@ class ECDFM(RunningWindowDebiaser):
         parameters = {"distribution": method, "variable": variable.name}
         return cls(**{**parameters, **kwargs})
 
+    def apply_location(self, obs, cm_hist, cm_future, *args, **kwargs):
+        if self.use_float32 and cm_future.dtype == np.float64:
+            return (
+                super()
+                .apply_location(
+                    obs.astype(np.float32),
+                    cm_hist.astype(np.float32),
+                    cm_future.astype(np.float32),
+                    *args,
+                    **kwargs,
+                )
+                .astype(np.float64)
+            )
+        return super().apply_location(obs, cm_hist, cm_future, *args, **kwargs)
+
     def apply_on_window(self, obs, cm_hist, cm_future, **kwargs):
-        fit_obs = self.distribution.fit(obs)
-        fit_cm_hist = self.distribution.fit(cm_hist)
-        fit_cm_future = self.distribution.fit(cm_future)
+        fit_obs = _fast_fit(self.distribution, obs)
+        fit_cm_hist = _fast_fit(self.distribution, cm_hist)
+        fit_cm_future = _fast_fit(self.distribution, cm_future)
+
+        transform = get_ecdfm_transform(self.distribution)
+        if transform is not None:
+            return transform(
+                cm_future, fit_cm_future, fit_obs, fit_cm_hist, self.cdf_threshold
+            )
+
+        # Fused in-place pipeline: one buffer for the quantiles, one for the output
+        quantile_cm_future = _fast_cdf(self.distribution, cm_future, *fit_cm_future)
+        np.clip(
+            quantile_cm_future,
+            self.cdf_threshold,
+            1 - self.cdf_threshold,
+            out=quantile_cm_future,
+        )
 
-        quantile_cm_future = threshold_cdf_vals(
-            self.distribution.cdf(cm_future, *fit_cm_future), self.cdf_threshold
+        debiased_cm_future = _fast_ppf(self.distribution, quantile_cm_future, *fit_obs)
+        np.subtract(
+            debiased_cm_future,
+            _fast_ppf(self.distribution, quantile_cm_future, *fit_cm_hist),
+            out=debiased_cm_future,
         )
+        np.add(debiased_cm_future, cm_future, out=debiased_cm_future)
+        return debiased_cm_future
+
+    def apply_location_running_window(
+        self,
+        obs,
+        cm_hist,
+        cm_future,
+        days_of_year_obs,
+        days_of_year_cm_hist,
+        days_of_year_cm_future,
+        time_obs,
+        time_cm_hist,
+        time_cm_future,
+    ):
+        """
+        Applies ECDFM at one location in running window mode, batching the cdf- and ppf-evaluations of all windows into single vectorized calls.
+
+        Distribution fits still happen once per window, however the cdf- and ppf-values of all windows are evaluated in one go on the concatenated cm_future-values, with the fit parameters repeated along the window segments. This removes the per-window scipy call overhead, whilst computing exactly the same values as the windowwise application.
+        Only possible for distributions in ``scipy.stats.rv_continuous`` whose fit parameters broadcast. For other models (eg. precipitation models wrapped in :py:class:`ibicus.utils.StatisticalModel`) the windowwise application of the parent class is used.
+        """
+        if not isinstance(self.distribution, scipy.stats.rv_continuous):
+            return super().apply_location_running_window(
+                obs,
+                cm_hist,
+                cm_future,
+                days_of_year_obs,
+                days_of_year_cm_hist,
+                days_of_year_cm_future,
+                time_obs,
+                time_cm_hist,
+                time_cm_future,
+            )
+
+        # Cache the attribute lookups of the loop body as locals
+        distribution = self.distribution
+        get_indices_vals_in_window = self.running_window.get_indices_vals_in_window
+
+        # Shared prework: window indices, masks and distribution fits per window center
+        indices_bias_corrected_values_per_window = []
+        cm_future_segments = []
+        fits_obs = []
+        fits_cm_hist = []
+        fits_cm_future = []
+
+        # The obs- and cm_hist-fits depend on the window center only, not on
+        # cm_future: memoize them by center so recurring centers reuse the fit
+        fit_obs_by_center = {}
+        fit_cm_hist_by_center = {}
+
+        for (
+            window_center,
+            indices_bias_corrected_values,
+        ) in self.running_window.use(days_of_year_cm_future):
+            if window_center not in fit_obs_by_center:
+                indices_window_obs = get_indices_vals_in_window(
+                    days_of_year_obs, window_center
+                )
+                indices_window_cm_hist = get_indices_vals_in_window(
+                    days_of_year_cm_hist, window_center
+                )
+                fit_obs_by_center[window_center] = _fast_fit(
+                    distribution, obs[indices_window_obs]
+                )
+                fit_cm_hist_by_center[window_center] = _fast_fit(
+                    distribution, cm_hist[indices_window_cm_hist]
+                )
+
+            indices_window_cm_future = get_indices_vals_in_window(
+                days_of_year_cm_future, window_center
+            )
 
-        return (
-            cm_future
-            + self.distribution.ppf(quantile_cm_future, *fit_obs)
-            - self.distribution.ppf(quantile_cm_future, *fit_cm_hist)
+            cm_future_window = cm_future[indices_window_cm_future]
+
+            mask_vals_to_adjust_in_window = (
+                RunningWindowOverDaysOfYear.get_mask_vals_to_adjust_in_window(
+                    indices_window_cm_future, indices_bias_corrected_values
+                )
+            )
+
+            indices_bias_corrected_values_per_window.append(
+                indices_bias_corrected_values
+            )
+            # The fit uses the whole window to preserve the statistics, but only
+            # the values that are actually bias corrected need transforming
+            cm_future_segments.append(cm_future_window[mask_vals_to_adjust_in_window])
+
+            fits_obs.append(fit_obs_by_center[window_center])
+            fits_cm_hist.append(fit_cm_hist_by_center[window_center])
+            fits_cm_future.append(_fast_fit(distribution, cm_future_window))
+
+        segment_lengths = [segment.size for segment in cm_future_segments]
+        cm_future_concat = np.concatenate(cm_future_segments)
+
+        # Repeat the fit parameters along the window segments so cdf and ppf run in one vectorized pass
+        fit_obs_broadcast = np.repeat(np.asarray(fits_obs), segment_lengths, axis=0)
+        fit_cm_hist_broadcast = np.repeat(
+            np.asarray(fits_cm_hist), segment_lengths, axis=0
+        )
+        fit_cm_future_broadcast = np.repeat(
+            np.asarray(fits_cm_future), segment_lengths, axis=0
         )
+
+        transform = get_ecdfm_transform(self.distribution)
+        if transform is not None:
+            debiased_concat = transform(
+                cm_future_concat,
+                tuple(fit_cm_future_broadcast.T),
+                tuple(fit_obs_broadcast.T),
+                tuple(fit_cm_hist_broadcast.T),
+                self.cdf_threshold,
+            )
+        else:
+            quantile_cm_future = _fast_cdf(
+                self.distribution, cm_future_concat, *fit_cm_future_broadcast.T
+            )
+            np.clip(
+                quantile_cm_future,
+                self.cdf_threshold,
+                1 - self.cdf_threshold,
+                out=quantile_cm_future,
+            )
+
+            debiased_concat = _fast_ppf(
+                self.distribution, quantile_cm_future, *fit_obs_broadcast.T
+            )
+            np.subtract(
+                debiased_concat,
+                _fast_ppf(
+                    self.distribution, quantile_cm_future, *fit_cm_hist_broadcast.T
+                ),
+                out=debiased_concat,
+            )
+            np.add(debiased_concat, cm_future_concat, out=debiased_concat)
+
+        # Scatter the segments back into the bias corrected values of each window
+        debiased_cm_future = np.empty_like(cm_future)
+        segment_start = 0
+        for indices_bias_corrected_values, segment_length in zip(
+            indices_bias_corrected_values_per_window, segment_lengths
+        ):
+            debiased_cm_future[indices_bias_corrected_values] = debiased_concat[
+                segment_start : segment_start + segment_length
+            ]
+            segment_start += segment_length
+        return debiased_cm_future
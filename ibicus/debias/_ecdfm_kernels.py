@@ -0,0 +1,91 @@
+# (C) Copyright 1996- ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+
+"""
+Specialized ECDFM transform kernels for common distributions.
+
+The generic ECDFM pipeline chains a cdf-, a clip- and two ppf-passes through
+scipy.stats. For the usual norm- and gamma-cases these kernels compute the same
+transformation fused into one function built on the bare scipy.special ufuncs,
+avoiding distribution dispatch and redundant special-function evaluations.
+"""
+
+import numpy as np
+import scipy.special
+import scipy.stats
+
+
+def _ecdfm_transform_norm(
+    cm_future, fit_cm_future, fit_obs, fit_cm_hist, cdf_threshold
+):
+    """
+    Fully specialized ECDFM transform for ``scipy.stats.norm``.
+
+    Since both ppf-evaluations share the quantiles, the transform reduces to
+    ``cm_future + (loc_obs - loc_cm_hist) + (scale_obs - scale_cm_hist) * ndtri(q)``.
+    Furthermore ``ndtri(clip(ndtr(z), cdf_threshold, 1 - cdf_threshold))`` equals
+    ``clip(z, ndtri(cdf_threshold), -ndtri(cdf_threshold))``, so the cdf-ppf
+    round trip collapses into a clip of the standardized values: no
+    special-function evaluation of the data remains at all. Fit parameters can
+    be scalars or arrays broadcasting against cm_future.
+    """
+    loc_cm_future, scale_cm_future = fit_cm_future
+    loc_obs, scale_obs = fit_obs
+    loc_cm_hist, scale_cm_hist = fit_cm_hist
+
+    z = (cm_future - loc_cm_future) / scale_cm_future
+    z_threshold = scipy.special.ndtri(cdf_threshold)
+    np.clip(z, z_threshold, -z_threshold, out=z)
+
+    return cm_future + (loc_obs - loc_cm_hist) + (scale_obs - scale_cm_hist) * z
+
+
+def _ecdfm_transform_gamma(
+    cm_future, fit_cm_future, fit_obs, fit_cm_hist, cdf_threshold
+):
+    """
+    Fused ECDFM transform for ``scipy.stats.gamma``, built on
+    ``scipy.special.gammainc``/``gammaincinv``. Fit parameters can be scalars or
+    arrays broadcasting against cm_future.
+    """
+    a_cm_future, loc_cm_future, scale_cm_future = fit_cm_future
+    a_obs, loc_obs, scale_obs = fit_obs
+    a_cm_hist, loc_cm_hist, scale_cm_hist = fit_cm_hist
+
+    q = scipy.special.gammainc(
+        a_cm_future, np.maximum((cm_future - loc_cm_future) / scale_cm_future, 0)
+    )
+    np.clip(q, cdf_threshold, 1 - cdf_threshold, out=q)
+
+    return (
+        cm_future
+        + loc_obs
+        + scale_obs * scipy.special.gammaincinv(a_obs, q)
+        - loc_cm_hist
+        - scale_cm_hist * scipy.special.gammaincinv(a_cm_hist, q)
+    )
+
+
+_specialized_transforms = {
+    "norm": _ecdfm_transform_norm,
+    "gamma": _ecdfm_transform_gamma,
+}
+
+
+def get_ecdfm_transform(distribution):
+    """
+    Returns the specialized ECDFM transform kernel for a distribution or None if no specialization exists.
+
+    Parameters
+    ----------
+    distribution :
+        Distribution or statistical model used by the debiaser.
+    """
+    if isinstance(distribution, scipy.stats.rv_continuous):
+        return _specialized_transforms.get(distribution.name)
+    return None
@@ -142,44 +142,17 @@ class RunningWindowDebiaser(Debiaser):
             days_of_year_cm_hist = day_of_year(time_cm_hist)
             days_of_year_cm_future = day_of_year(time_cm_future)
 
-            debiased_cm_future = np.empty_like(cm_future)
-
-            # Iteration over year to account for seasonality
-            for (
-                window_center,
-                indices_bias_corrected_values,
-            ) in self.running_window.use(days_of_year_cm_future):
-                indices_window_obs = self.running_window.get_indices_vals_in_window(
-                    days_of_year_obs, window_center
-                )
-                indices_window_cm_hist = self.running_window.get_indices_vals_in_window(
-                    days_of_year_cm_hist, window_center
-                )
-                indices_window_cm_future = (
-                    self.running_window.get_indices_vals_in_window(
-                        days_of_year_cm_future, window_center
-                    )
-                )
-
-                mask_vals_to_adjust_in_window = (
-                    RunningWindowOverDaysOfYear.get_mask_vals_to_adjust_in_window(
-                        indices_window_cm_future, indices_bias_corrected_values
-                    )
-                )
-
-                debiased_cm_future[
-                    indices_bias_corrected_values
-                ] = self.apply_on_window(
-                    obs=obs[indices_window_obs],
-                    cm_hist=cm_hist[indices_window_cm_hist],
-                    cm_future=cm_future[indices_window_cm_future],
-                    time_obs=time_obs[indices_window_obs],
-                    time_cm_hist=time_cm_hist[indices_window_cm_hist],
-                    time_cm_future=time_cm_future[indices_window_cm_future],
-                )[
-                    mask_vals_to_adjust_in_window
-                ]
-            return debiased_cm_future
+            return self.apply_location_running_window(
+                obs,
+                cm_hist,
+                cm_future,
+                days_of_year_obs,
+                days_of_year_cm_hist,
+                days_of_year_cm_future,
+                time_obs,
+                time_cm_hist,
+                time_cm_future,
+            )
 
         else:
             return self.apply_on_window(
@@ -190,3 +163,87 @@ class RunningWindowDebiaser(Debiaser):
                 time_cm_hist=time_cm_hist,
                 time_cm_future=time_cm_future,
             )
+
+    def apply_location_running_window(
+        self,
+        obs: np.ndarray,
+        cm_hist: np.ndarray,
+        cm_future: np.ndarray,
+        days_of_year_obs: np.ndarray,
+        days_of_year_cm_hist: np.ndarray,
+        days_of_year_cm_future: np.ndarray,
+        time_obs: np.ndarray,
+        time_cm_hist: np.ndarray,
+        time_cm_future: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Applies the debiaser at one location in running window mode: iterates the running window over the days of the year and applies :py:func:`apply_on_window` on each window.
+
+        Child classes can overwrite this method to provide an optimised treatment of the running window iteration whilst reusing the time handling of :py:func:`apply_location`.
+
+        Parameters
+        ----------
+        obs : np.ndarray
+            1-dimensional numpy array of observations of the meteorological variable at one location.
+        cm_hist : np.ndarray
+            1-dimensional numpy array of values of the historical climate model run (run during the same or a similar period as observations) at one location.
+        cm_future : np.ndarray
+            1-dimensional numpy array of values of a climate model to debias (future run) at one location.
+        days_of_year_obs : np.ndarray
+            1-dimensional numpy array of days of year corresponding to obs.
+        days_of_year_cm_hist : np.ndarray
+            1-dimensional numpy array of days of year corresponding to cm_hist.
+        days_of_year_cm_future : np.ndarray
+            1-dimensional numpy array of days of year corresponding to cm_future.
+
+        Returns
+        -------
+        np.ndarray
+            1-dimensional numpy array containing the debiased climate model values for the future run (cm_future).
+        """
+
+        debiased_cm_future = np.empty_like(cm_future)
+
+        # Shared prework: window indices depend only on the window center, so
+        # compute them once per distinct center instead of inside the iteration
+        get_indices_vals_in_window = self.running_window.get_indices_vals_in_window
+
+        windows = list(self.running_window.use(days_of_year_cm_future))
+        indices_window_obs_by_center = {
+            window_center: get_indices_vals_in_window(days_of_year_obs, window_center)
+            for window_center, _ in windows
+        }
+        indices_window_cm_hist_by_center = {
+            window_center: get_indices_vals_in_window(
+                days_of_year_cm_hist, window_center
+            )
+            for window_center, _ in windows
+        }
+        indices_window_cm_future_by_center = {
+            window_center: get_indices_vals_in_window(
+                days_of_year_cm_future, window_center
+            )
+            for window_center, _ in windows
+        }
+
+        # Iteration over year to account for seasonality
+        for window_center, indices_bias_corrected_values in windows:
+            indices_window_obs = indices_window_obs_by_center[window_center]
+            indices_window_cm_hist = indices_window_cm_hist_by_center[window_center]
+            indices_window_cm_future = indices_window_cm_future_by_center[window_center]
+
+            mask_vals_to_adjust_in_window = (
+                RunningWindowOverDaysOfYear.get_mask_vals_to_adjust_in_window(
+                    indices_window_cm_future, indices_bias_corrected_values
+                )
+            )
+
+            debiased_cm_future[indices_bias_corrected_values] = self.apply_on_window(
+                obs=obs[indices_window_obs],
+                cm_hist=cm_hist[indices_window_cm_hist],
+                cm_future=cm_future[indices_window_cm_future],
+                time_obs=time_obs[indices_window_obs],
+                time_cm_hist=time_cm_hist[indices_window_cm_hist],
+                time_cm_future=time_cm_future[indices_window_cm_future],
+            )[mask_vals_to_adjust_in_window]
+        return debiased_cm_future
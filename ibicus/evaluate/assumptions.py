@@ -24,17 +24,9 @@ from statsmodels.graphics.tsaplots import plot_acf
 from ..variables import map_variable_str_to_variable_class, str_to_variable_class
 
 
-def _calculate_aic(dataset, distribution):
-
-    fit = distribution.fit(dataset)
-
-    k = len(fit)
-    logLik = np.sum(distribution.logpdf(dataset, *fit))
-
-    return 2 * k - 2 * (logLik)
-
-
-def calculate_aic(variable: str, dataset: np.ndarray, *distributions) -> pd.DataFrame:
+def calculate_aic(
+    variable: str, dataset: np.ndarray, *distributions, n_jobs: Optional[int] = None
+) -> pd.DataFrame:
 
     """
     Calculates the Akaike Information Criterion (AIC) at each location for each of the distributions specified.
@@ -49,6 +41,8 @@ def calculate_aic(variable: str, dataset: np.ndarray, *distributions) -> pd.Data
         Input data, either observations or climate projections dataset to be analysed, numeric entries expected.
     *distributions : list[scipy.stats.rv_continuous]
         Distributions to be tested, elements are scipy.stats.rv_continuous
+    n_jobs : Optional[int]
+        If set, the distribution fits of the grid cells are run in parallel with that many joblib thread workers (``-1`` for all cores). The attainable speedup depends on how much of the fit runs outside the GIL, which is limited for the generic scipy optimizer - mainly useful for distributions with more expensive vectorized fits. Default: ``None`` (serial).
 
     Returns
     -------
@@ -56,20 +50,50 @@ def calculate_aic(variable: str, dataset: np.ndarray, *distributions) -> pd.Data
         DataFrame with all locations, distributions and associated AIC values.
     """
 
-    aic = []
-    for distribution in distributions:
-        for i, j in np.ndindex(dataset.shape[1:]):
-            aic.append(
+    data_2d = dataset.reshape(dataset.shape[0], -1)
+    nr_locations = data_2d.shape[1]
+
+    x_locations, y_locations = np.unravel_index(
+        np.arange(nr_locations), dataset.shape[1:]
+    )
+    aic_values = np.empty(len(distributions) * nr_locations)
+
+    for nr_distribution, distribution in enumerate(distributions):
+        if n_jobs is not None:
+            from joblib import Parallel, delayed
+
+            fits = np.asarray(
+                Parallel(n_jobs=n_jobs, prefer="threads")(
+                    delayed(distribution.fit)(data_2d[:, location])
+                    for location in range(nr_locations)
+                )
+            )
+        else:
+            fits = np.asarray(
                 [
-                    i,
-                    j,
-                    _calculate_aic(dataset[:, i, j], distribution),
-                    distribution.name,
+                    distribution.fit(data_2d[:, location])
+                    for location in range(nr_locations)
                 ]
             )
-
-    aic_dataframe = pd.DataFrame(aic, columns=["x", "y", "AIC value", "Distribution"])
-    aic_dataframe["AIC value"] = pd.to_numeric(aic_dataframe["AIC value"])
+        nr_parameters = fits.shape[1]
+
+        # evaluate the logpdf of all locations in one vectorized call,
+        # with the fit parameters broadcast across the time axis
+        log_likelihood = distribution.logpdf(data_2d, *fits.T).sum(axis=0)
+        aic_values[
+            nr_distribution * nr_locations : (nr_distribution + 1) * nr_locations
+        ] = (2 * nr_parameters - 2 * log_likelihood)
+
+    aic_dataframe = pd.DataFrame(
+        {
+            "x": np.tile(x_locations, len(distributions)),
+            "y": np.tile(y_locations, len(distributions)),
+            "AIC value": aic_values,
+            "Distribution": np.repeat(
+                [distribution.name for distribution in distributions], nr_locations
+            ),
+        }
+    )
 
     return aic_dataframe
 
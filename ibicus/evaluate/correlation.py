@@ -10,19 +10,18 @@
 Correlation module - Calculate and plot the RMSE between spatial correlation matrices at each location.
 """
 
-import math
+from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import seaborn
-import sklearn.metrics
 
 from ..variables import map_variable_str_to_variable_class, str_to_variable_class
 
 
 def rmse_spatial_correlation_distribution(
-    variable: str, obs_data: np.ndarray, **cm_data
+    variable: str, obs_data: np.ndarray, n_jobs: Optional[int] = None, **cm_data
 ) -> pd.DataFrame:
     """
     Calculates Root-Mean-Squared-Error between observed and modelled spatial correlation matrix at each location.
@@ -36,6 +35,8 @@ def rmse_spatial_correlation_distribution(
         Variable name, has to be given in standard form specified in documentation.
     obs_data : np.ndarray
         Optional argument present in all plot functions: manual_title will be used as title of the plot.
+    n_jobs : Optional[int]
+        If set, the correlation matrices of the climate model datasets are computed in parallel with that many joblib workers (``-1`` for all cores). Default: ``None`` (serial).
     cm_data :
         Keyword arguments specifying climate model datasets, for example: QM = tas_debiased_QM
 
@@ -45,45 +46,48 @@ def rmse_spatial_correlation_distribution(
 
     """
 
-    rmsd_arrays = []
+    nr_lats, nr_lons = obs_data.shape[1], obs_data.shape[2]
 
-    for k in cm_data.keys():
+    # calculate the full correlation matrix of each dataset in one go:
+    # row a*nr_lons+b contains the correlation of location (a, b) to all other
+    # locations. The observational one is shared between all correction methods.
+    corr_obs = np.corrcoef(obs_data.reshape(obs_data.shape[0], -1), rowvar=False)
 
-        for a, b in np.ndindex(obs_data.shape[1:]):
+    x_locations, y_locations = np.unravel_index(
+        np.arange(nr_lats * nr_lons), (nr_lats, nr_lons)
+    )
 
-            # initialize two arrays to be filled with correlation values
-            corr_matrix_obs = np.zeros((obs_data.shape[1], obs_data.shape[2]))
-            corr_matrix_cm = np.zeros((obs_data.shape[1], obs_data.shape[2]))
+    def _correlation_matrix(dataset):
+        return np.corrcoef(dataset.reshape(dataset.shape[0], -1), rowvar=False)
 
-            for i, j in np.ndindex(obs_data.shape[1:]):
+    if n_jobs is not None:
+        from joblib import Parallel, delayed
 
-                corr_matrix_obs[i, j] = np.corrcoef(
-                    obs_data[:, a, b], obs_data[:, i, j]
-                )[0, 1]
-                corr_matrix_cm[i, j] = np.corrcoef(
-                    cm_data[k][:, a, b], cm_data[k][:, i, j]
-                )[0, 1]
+        corr_cms = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_correlation_matrix)(cm_data[k]) for k in cm_data.keys()
+        )
+    else:
+        corr_cms = [_correlation_matrix(cm_data[k]) for k in cm_data.keys()]
 
-            # calculate rmsd between two correlation matrices
-            rmsd = math.sqrt(
-                sklearn.metrics.mean_squared_error(corr_matrix_obs, corr_matrix_cm)
-            )
+    rmsd_arrays = []
+
+    for k, corr_cm in zip(cm_data.keys(), corr_cms):
 
-            rmsd_arrays.append(
-                pd.DataFrame(
-                    data={
-                        "x": [a],
-                        "y": [b],
-                        "Correction Method": k,
-                        "RMSE spatial correlation": rmsd,
-                    }
-                )
+        # calculate rmsd between the correlation matrices of all locations at once
+        rmsd = np.sqrt(((corr_obs - corr_cm) ** 2).mean(axis=1))
+
+        rmsd_arrays.append(
+            pd.DataFrame(
+                data={
+                    "x": x_locations,
+                    "y": y_locations,
+                    "Correction Method": k,
+                    "RMSE spatial correlation": rmsd,
+                }
             )
+        )
 
     rmsd_data = pd.concat(rmsd_arrays)
-    rmsd_data["RMSE spatial correlation"] = pd.to_numeric(
-        rmsd_data["RMSE spatial correlation"]
-    )
 
     return rmsd_data
 
@@ -14,6 +14,7 @@ from typing import Optional
 import attrs
 import numpy as np
 import scipy.optimize
+import scipy.special
 import scipy.stats
 import statsmodels.distributions.empirical_distribution
 
@@ -94,6 +95,93 @@ class StatisticalModel(ABC):
         pass
 
 
+def _fast_fit(distribution, data: np.ndarray, **fit_kwds) -> tuple:
+    """
+    Fits a distribution using closed-form maximum likelihood estimators where available, falling back to ``distribution.fit`` otherwise.
+
+    ``scipy.stats.rv_continuous.fit`` runs a generic numerical optimizer even for distributions with cheap analytic estimators. This dispatches on the distribution:
+    for ``scipy.stats.norm`` the exact MLE ``(mean, std)`` is returned and for ``scipy.stats.gamma`` with ``floc = 0`` the Thom/Minka closed-form approximation of the MLE is used.
+    All other distributions and fit-arguments fall back to ``distribution.fit(data, **fit_kwds)``.
+
+    Parameters
+    ----------
+    distribution : scipy.stats.rv_continuous
+        Distribution to fit.
+    data : np.ndarray
+        Array containing values on which the distribution is to fit.
+    fit_kwds :
+        Keyword arguments passed to ``distribution.fit`` (eg. ``floc``).
+    """
+    if isinstance(distribution, scipy.stats.rv_continuous):
+        if distribution.name == "norm" and not fit_kwds:
+            return (np.mean(data), np.std(data))
+        if (
+            distribution.name == "gamma"
+            and set(fit_kwds.keys()) <= {"floc", "fscale"}
+            and fit_kwds.get("floc") == 0
+            and fit_kwds.get("fscale") is None
+            and data.size > 0
+            and np.all(data > 0)
+        ):
+            mean = np.mean(data)
+            s = np.log(mean) - np.mean(np.log(data))
+            if s > 0:
+                k = (3 - s + np.sqrt((s - 3) ** 2 + 24 * s)) / (12 * s)
+                return (k, 0.0, mean / k)
+    return distribution.fit(data, **fit_kwds)
+
+
+def _fast_cdf(distribution, x: np.ndarray, *fit: tuple) -> np.ndarray:
+    """
+    Evaluates the cdf of a distribution, using the bare ``scipy.special`` ufuncs where available and falling back to ``distribution.cdf`` otherwise.
+
+    ``scipy.stats`` cdf-calls wrap the actual computation in argument validation, broadcasting and parameter handling on every call.
+    For ``scipy.stats.norm`` and ``scipy.stats.gamma`` this calls ``scipy.special.ndtr`` respectively ``scipy.special.gammainc`` directly: same numerics, without the wrapping overhead.
+
+    Parameters
+    ----------
+    distribution : scipy.stats.rv_continuous
+        Distribution whose cdf is evaluated.
+    x : np.ndarray
+        Values for which the cdf shall be evaluated.
+    fit : tuple
+        Parameters controling the distribution fit. Return value of fit.
+    """
+    if isinstance(distribution, scipy.stats.rv_continuous):
+        if distribution.name == "norm":
+            loc, scale = fit
+            return scipy.special.ndtr((x - loc) / scale)
+        if distribution.name == "gamma":
+            a, loc, scale = fit
+            return scipy.special.gammainc(a, np.maximum((x - loc) / scale, 0))
+    return distribution.cdf(x, *fit)
+
+
+def _fast_ppf(distribution, q: np.ndarray, *fit: tuple) -> np.ndarray:
+    """
+    Evaluates the ppf (quantile / inverse cdf) of a distribution, using the bare ``scipy.special`` ufuncs where available and falling back to ``distribution.ppf`` otherwise.
+
+    Counterpart of :py:func:`_fast_cdf`: for ``scipy.stats.norm`` and ``scipy.stats.gamma`` this calls ``scipy.special.ndtri`` respectively ``scipy.special.gammaincinv`` directly.
+
+    Parameters
+    ----------
+    distribution : scipy.stats.rv_continuous
+        Distribution whose ppf is evaluated.
+    q : np.ndarray
+        Values for which the ppf shall be evaluated.
+    fit : tuple
+        Parameters controling the distribution fit. Return value of fit.
+    """
+    if isinstance(distribution, scipy.stats.rv_continuous):
+        if distribution.name == "norm":
+            loc, scale = fit
+            return loc + scale * scipy.special.ndtri(q)
+        if distribution.name == "gamma":
+            a, loc, scale = fit
+            return loc + scale * scipy.special.gammaincinv(a, q)
+    return distribution.ppf(q, *fit)
+
+
 """----- Precipitation helpers -----"""
 
 
@@ -138,9 +226,9 @@ class gen_PrecipitationIgnoreZeroValuesModel(StatisticalModel):
         """
         rainy_days = data[data != 0]
         if self.fit_kwds is None:
-            fit_rainy_days = self.distribution.fit(rainy_days)
+            fit_rainy_days = _fast_fit(self.distribution, rainy_days)
         else:
-            fit_rainy_days = self.distribution.fit(rainy_days, **self.fit_kwds)
+            fit_rainy_days = _fast_fit(self.distribution, rainy_days, **self.fit_kwds)
 
         return fit_rainy_days
 
@@ -245,9 +333,9 @@ class gen_PrecipitationHurdleModel(StatisticalModel):
 
         p0 = 1 - rainy_days.shape[0] / data.shape[0]
         if self.fit_kwds is None:
-            fit_rainy_days = self.distribution.fit(rainy_days)
+            fit_rainy_days = _fast_fit(self.distribution, rainy_days)
         else:
-            fit_rainy_days = self.distribution.fit(rainy_days, **self.fit_kwds)
+            fit_rainy_days = _fast_fit(self.distribution, rainy_days, **self.fit_kwds)
 
         return (p0, fit_rainy_days)
 
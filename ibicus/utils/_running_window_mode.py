@@ -362,10 +362,21 @@ class RunningWindowOverDaysOfYear:
 
     @staticmethod
     def get_mask_vals_to_adjust_in_window(indices_window, indices_vals_to_correct):
-        return np.logical_and(
-            np.in1d(indices_window, indices_vals_to_correct),
-            get_mask_for_unique_subarray(indices_window),
+        if indices_window.size == 0:
+            return np.zeros(0, dtype=bool)
+
+        # O(1) membership lookup instead of the sort-based set intersection of np.in1d
+        membership = np.zeros(
+            max(indices_window.max(), indices_vals_to_correct.max(initial=0)) + 1,
+            dtype=bool,
         )
+        membership[indices_vals_to_correct] = True
+        mask = membership[indices_window]
+
+        # A first-occurrence filter is only needed if indices_window contains duplicates
+        if not np.all(np.diff(indices_window) > 0):
+            mask = np.logical_and(mask, get_mask_for_unique_subarray(indices_window))
+        return mask
 
     def use(self, days_of_year: np.ndarray) -> np.ndarray:
         """
@@ -15,9 +15,11 @@ import unittest
 import numpy as np
 import scipy.stats
 
-from ibicus.debias import ECDFM
+from ibicus.debias import ECDFM, RunningWindowDebiaser
 from ibicus.utils import (
     PrecipitationHurdleModelGamma,
+    create_array_of_consecutive_dates,
+    day_of_year,
     gen_PrecipitationGammaLeftCensoredModel,
 )
 
@@ -202,6 +204,73 @@ class TestECDFM(unittest.TestCase):
             tas.apply_location(obs, cm_hist, cm_future), cm_future - 5, atol=1e-5
         )
 
+    def test_apply_location_running_window_mode(self):
+        time = create_array_of_consecutive_dates(1000)
+        days_of_year_time = day_of_year(time)
+
+        # Check both a distribution with a specialized transform kernel (norm)
+        # and one going through the generic rv_continuous path (beta)
+        for distribution, obs, cm_future in [
+            (
+                scipy.stats.norm,
+                np.random.normal(280, 5, size=1000),
+                np.random.normal(284, 5, size=1000),
+            ),
+            (
+                scipy.stats.beta,
+                np.random.beta(5, 2, size=1000),
+                np.random.beta(7, 3, size=1000),
+            ),
+        ]:
+            debiaser = ECDFM(
+                distribution=distribution,
+                running_window_mode=True,
+                running_window_length=91,
+                running_window_step_length=31,
+            )
+
+            # Test: perfect match between obs and cm_hist
+            assert np.allclose(
+                debiaser.apply_location(obs, obs, cm_future, time, time, time),
+                cm_future,
+            )
+
+            # Test: batched application matches the windowwise iteration of the
+            # parent class
+            cm_hist = obs + 0.1
+            debiased = debiaser.apply_location(
+                obs, cm_hist, cm_future, time, time, time
+            )
+            debiased_windowwise = RunningWindowDebiaser.apply_location_running_window(
+                debiaser,
+                obs,
+                cm_hist,
+                cm_future,
+                days_of_year_time,
+                days_of_year_time,
+                days_of_year_time,
+                time,
+                time,
+                time,
+            )
+            assert np.allclose(debiased, debiased_windowwise)
+
+    def test_apply_location_use_float32(self):
+        obs = np.random.normal(280, 5, size=1000)
+        cm_hist = obs + 2
+        cm_future = np.random.normal(284, 5, size=1000)
+
+        tas = ECDFM(distribution=scipy.stats.norm)
+        tas_float32 = ECDFM(distribution=scipy.stats.norm, use_float32=True)
+
+        debiased = tas.apply_location(obs, cm_hist, cm_future)
+        debiased_float32 = tas_float32.apply_location(obs, cm_hist, cm_future)
+
+        # Output dtype is unchanged and the result stays well within the
+        # physical resolution of daily data
+        assert debiased_float32.dtype == np.float64
+        assert np.allclose(debiased, debiased_float32, atol=1e-2)
+
     def test_apply_location_pr(self):
         # Compare all values
 
@@ -10,22 +10,37 @@
 Demo tests for raw template.
 """
 
+import copy
+import functools
 import unittest
 
 import numpy as np
-import scipy.stats
 
 from ibicus.debias import ISIMIP
 
 
+@functools.lru_cache(maxsize=None)
+def get_window_centers_for_step_length(step_length):
+    """Window centers of a 366-day year for a window length of 31 days, cached per step length across tests."""
+    debiaser = ISIMIP.from_variable("pr")
+    debiaser.running_window_mode = True
+    debiaser.running_window_length = 31
+    debiaser.running_window_step_length = step_length
+    return debiaser._get_window_centers(366)
+
+
 class TestISIMIPsteps(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         np.random.seed(12345)
+        # Construct the debiasers once per class: tests that mutate attributes
+        # take a deepcopy, the others use the shared instances directly
+        cls.prsnratio_debiaser = ISIMIP.from_variable("prsnratio")
+        cls.pr_debiaser = ISIMIP.from_variable("pr")
+        cls.rsds_debiaser = ISIMIP.from_variable("rsds")
 
     def test_step2_all_missing(self):
-        variable = "prsnratio"
-        debiaser = ISIMIP.from_variable(variable)
+        debiaser = self.prsnratio_debiaser
 
         obs_hist = np.array([np.nan for i in range(1000)])
         cm_hist = np.array([np.nan for i in range(1000)])
@@ -37,8 +52,7 @@ class TestISIMIPsteps(unittest.TestCase):
             )
 
     def test_step2_none_missing(self):
-        variable = "prsnratio"
-        debiaser = ISIMIP.from_variable(variable)
+        debiaser = self.prsnratio_debiaser
 
         obs_hist = np.random.random(1000)
         cm_hist = np.random.random(1000)
@@ -53,8 +67,7 @@ class TestISIMIPsteps(unittest.TestCase):
         assert all(imputed_cm_future == cm_future)
 
     def test_step2(self):
-        variable = "prsnratio"
-        debiaser = ISIMIP.from_variable(variable)
+        debiaser = self.prsnratio_debiaser
 
         obs_hist = np.random.random(1000)
         cm_hist = np.random.random(1000)
@@ -100,47 +113,46 @@ class TestISIMIPsteps(unittest.TestCase):
         assert np.isclose(P_obs_future, 0.1)
 
     def test_step4_correct_sort_lower_threshold(self):
-        debiaser = ISIMIP.from_variable("pr")
-        cm_future = scipy.stats.gamma.rvs(a=1, size=1000)
+        debiaser = copy.deepcopy(self.pr_debiaser)
+        rng = np.random.default_rng(42)
+        cm_future = rng.gamma(1.0, size=1000)
         debiaser.lower_threshold = np.quantile(cm_future, 0.1)
 
         step4_output, _, _ = debiaser.step4(cm_future, cm_future, cm_future)
-        step4_outside_thresholds = step4_output[
-            np.logical_not(
-                debiaser._get_mask_for_values_between_thresholds(step4_output)
-            )
-        ]
-        cm_future_outside_bounds = cm_future[
-            np.logical_not(debiaser._get_mask_for_values_between_thresholds(cm_future))
-        ]
+        mask_step4_output = debiaser._get_mask_for_values_between_thresholds(
+            step4_output
+        )
+        mask_cm_future = debiaser._get_mask_for_values_between_thresholds(cm_future)
+        step4_outside_thresholds = step4_output[~mask_step4_output]
+        cm_future_outside_bounds = cm_future[~mask_cm_future]
 
-        assert all(
-            np.argsort(step4_outside_thresholds) == np.argsort(cm_future_outside_bounds)
+        assert np.array_equal(
+            np.argsort(step4_outside_thresholds), np.argsort(cm_future_outside_bounds)
         )
 
     def test_step4_correct_sort_bounded_variable(self):
-        debiaser = ISIMIP.from_variable("rsds")
-        cm_future = scipy.stats.beta.rvs(a=1, b=2, size=1000)
+        debiaser = copy.deepcopy(self.rsds_debiaser)
+        rng = np.random.default_rng(42)
+        cm_future = rng.beta(1.0, 2.0, size=1000)
         debiaser.lower_threshold = np.quantile(cm_future, 0.1)
         debiaser.upper_threshold = np.quantile(cm_future, 0.9)
 
         step4_output, _, _ = debiaser.step4(cm_future, cm_future, cm_future)
-        step4_outside_thresholds = step4_output[
-            np.logical_not(
-                debiaser._get_mask_for_values_between_thresholds(step4_output)
-            )
-        ]
-        cm_future_outside_bounds = cm_future[
-            np.logical_not(debiaser._get_mask_for_values_between_thresholds(cm_future))
-        ]
+        mask_step4_output = debiaser._get_mask_for_values_between_thresholds(
+            step4_output
+        )
+        mask_cm_future = debiaser._get_mask_for_values_between_thresholds(cm_future)
+        step4_outside_thresholds = step4_output[~mask_step4_output]
+        cm_future_outside_bounds = cm_future[~mask_cm_future]
 
-        assert all(
-            np.argsort(step4_outside_thresholds) == np.argsort(cm_future_outside_bounds)
+        assert np.array_equal(
+            np.argsort(step4_outside_thresholds), np.argsort(cm_future_outside_bounds)
         )
 
     def test_step4_values_between_thresholds_unchanged(self):
-        debiaser = ISIMIP.from_variable("rsds")
-        cm_future = scipy.stats.beta.rvs(a=1, b=2, size=1000)
+        debiaser = copy.deepcopy(self.rsds_debiaser)
+        rng = np.random.default_rng(42)
+        cm_future = rng.beta(1.0, 2.0, size=1000)
         debiaser.lower_threshold = np.quantile(cm_future, 0.1)
         debiaser.upper_threshold = np.quantile(cm_future, 0.9)
 
@@ -150,7 +162,7 @@ class TestISIMIPsteps(unittest.TestCase):
             cm_future
         )
 
-        assert all(step4_between_thresholds == cm_future_between_thresholds)
+        assert np.array_equal(step4_between_thresholds, cm_future_between_thresholds)
 
     def do_not_run_test__step6_transform_nr_of_entries_to_set_to_upper_bound_to_mask_for_cm_future(
         self,
@@ -185,63 +197,62 @@ class TestISIMIPRunningWindowIteration(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         np.random.seed(12345)
+        cls.pr_debiaser = ISIMIP.from_variable("pr")
 
     def do_not_run_test__get_window_centers(self):
-        debiaser = ISIMIP.from_variable("pr")
+        debiaser = copy.deepcopy(self.pr_debiaser)
         debiaser.running_window_mode = True
         debiaser.running_window_length = 31
 
         for i in range(1, 30):
-            debiaser.running_window_step_length = i
-            window_centers = debiaser._get_window_centers(366)
-
-            # Not day appearing only every four years in there
-            assert 366 not in window_centers
-            if 366 % debiaser.running_window_step_length > 0:
-                # Enough window centers
-                assert (
-                    window_centers.size
-                    == (366 // debiaser.running_window_step_length) + 1
-                )
-                # First and last window-center not drastically different
-                # assert window_centers[0] - (366 - window_centers[-1]) <= 1
-            else:
-                # Enough window centers
-                assert window_centers.size == (
-                    366 // debiaser.running_window_step_length
+            with self.subTest(step_length=i):
+                debiaser.running_window_step_length = i
+                window_centers = get_window_centers_for_step_length(i)
+
+                # Not day appearing only every four years in there
+                assert not np.isin(366, window_centers)
+                if 366 % debiaser.running_window_step_length > 0:
+                    # Enough window centers
+                    assert (
+                        window_centers.size
+                        == (366 // debiaser.running_window_step_length) + 1
+                    )
+                    # First and last window-center not drastically different
+                    # assert window_centers[0] - (366 - window_centers[-1]) <= 1
+                else:
+                    # Enough window centers
+                    assert window_centers.size == (
+                        366 // debiaser.running_window_step_length
+                    )
+                # Equally spaced: except last one: when 366 is replaced by 365
+                assert np.all(
+                    np.diff(window_centers[:-1]) == debiaser.running_window_step_length
                 )
-            # Equally spaced: except last one: when 366 is replaced by 365
-            assert all(
-                window_centers[1 : (window_centers.size - 1)]
-                - window_centers[0 : (window_centers.size - 2)]
-                == debiaser.running_window_step_length
-            )
 
     def do_not_run_test__get_indices_around_window_center(self):
-        debiaser = ISIMIP.from_variable("pr")
+        debiaser = copy.deepcopy(self.pr_debiaser)
         debiaser.running_window_mode = True
         debiaser.running_window_length = 31
 
-        days_of_years = np.repeat(np.tile(1, 367), 10)
+        # Representative day-of-year values over ten years, so the window and
+        # modulo logic is actually exercised for every center
+        days_of_years = np.tile(np.arange(1, 367), 10)
+
+        # The window offsets only depend on the (fixed) window length
+        half_window_length = debiaser.running_window_length // 2
+        offsets = np.arange(-half_window_length, half_window_length + 1)
+
         for i in range(1, 30):
-            debiaser.running_window_step_length = i
-            window_centers = debiaser._get_window_centers(366)
-            for center in window_centers:
-                indices = debiaser._get_indices_around_window_center(
-                    days_of_years, center
-                )
-                # Check all indexes that we would expect in window are part of:
-                indices_center = np.where(days_of_years == center)[0]
-                window_indexes = np.concatenate(
-                    [
-                        np.mod(
-                            np.arange(
-                                index_center - debiaser.running_window_length // 2,
-                                index_center + debiaser.running_window_length // 2 + 1,
-                            ),
-                            days_of_years.size,
-                        )
-                        for index_center in indices_center
-                    ]
-                )
-                assert all(x in indices for x in window_indexes)
+            with self.subTest(step_length=i):
+                debiaser.running_window_step_length = i
+                window_centers = get_window_centers_for_step_length(i)
+                for center in window_centers:
+                    indices = debiaser._get_indices_around_window_center(
+                        days_of_years, center
+                    )
+                    # Check all indexes that we would expect in window are part of:
+                    indices_center = np.flatnonzero(days_of_years == center)
+                    window_indexes = np.mod(
+                        indices_center[:, None] + offsets[None, :], days_of_years.size
+                    ).ravel()
+                    assert np.isin(window_indexes, indices).all()
@@ -112,3 +112,43 @@ class TestQuantileMapping(unittest.TestCase):
         tas = QuantileMapping.from_variable("tas", running_window_mode=True)
         debiased = tas.apply(obs, cm_hist, cm_future)
         assert scipy.stats.kstest(debiased.flatten(), obs.flatten())[0] <= 0.5
+
+    def test_apply_location_use_float32(self):
+        obs = np.random.normal(280, 4, size=1000)
+        cm_hist = obs + 2
+        cm_future = np.random.normal(283, 4, size=1000)
+
+        tas = QuantileMapping.from_variable("tas", running_window_mode=False)
+        tas_float32 = QuantileMapping.from_variable(
+            "tas", running_window_mode=False, use_float32=True
+        )
+
+        debiased = tas.apply_location(obs, cm_hist, cm_future)
+        debiased_float32 = tas_float32.apply_location(obs, cm_hist, cm_future)
+
+        # Output dtype is unchanged and the result stays well within the
+        # physical resolution of daily data
+        assert debiased_float32.dtype == np.float64
+        assert np.allclose(debiased, debiased_float32, atol=1e-2)
+
+    def test_apply_location_lut_size(self):
+        obs = np.random.normal(280, 4, size=1000)
+        cm_hist = obs + 2
+        cm_future = np.random.normal(283, 4, size=1000)
+
+        tas = QuantileMapping.from_variable("tas", running_window_mode=False)
+        tas_lut = QuantileMapping.from_variable(
+            "tas", running_window_mode=False, lut_size=256
+        )
+
+        debiased = tas.apply_location(obs, cm_hist, cm_future)
+        debiased_lut = tas_lut.apply_location(obs, cm_hist, cm_future)
+
+        # The interpolated mapping is close to the exact one
+        assert np.allclose(debiased, debiased_lut, atol=1e-8)
+
+        # Arrays not larger than lut_size take the exact path
+        assert np.array_equal(
+            tas.apply_location(obs[:256], cm_hist[:256], cm_future[:256]),
+            tas_lut.apply_location(obs[:256], cm_hist[:256], cm_future[:256]),
+        )